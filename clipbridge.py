@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import logging
-import queue
+import os
 import selectors
 import shutil
 import socket
@@ -9,7 +9,22 @@ import struct
 import subprocess
 import threading
 import time
-from typing import Dict, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+try:
+    from Xlib import X
+    from Xlib import display as _x_display
+    from Xlib.ext import xfixes as _x_xfixes
+except ImportError:
+    _x_display = None
+
+try:
+    from pywayland.client import Display as _WlDisplay
+    from pywayland.protocol.wayland import WlSeat
+    from pywayland.protocol.wlr_data_control_unstable_v1 import ZwlrDataControlManagerV1
+except ImportError:
+    _WlDisplay = None
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -17,30 +32,50 @@ logger = logging.getLogger(__name__)
 
 MSG_TEXT = 0x01
 MAX_BYTES = 1_048_576
+DEBOUNCE_SECONDS = 0.02
+MAX_BATCH_BYTES = 65536
+MAX_WBUF_BYTES = 4 * 1024 * 1024
+_HDR = struct.Struct(">BI")
+_MSG_MORE = getattr(socket, "MSG_MORE", 0)
+# One max-size frame plus a full recv still fits without compaction.
+RBUF_SIZE = MAX_BYTES + 5 + 65536
 
 
-def frame_text(text: str) -> bytes:
-    data = text.encode("utf-8")
+def frame_data(data: bytes) -> bytes:
     if len(data) > MAX_BYTES:
         raise ValueError("payload too large")
-    return bytes([MSG_TEXT]) + struct.pack(">I", len(data)) + data
+    return _HDR.pack(MSG_TEXT, len(data)) + data
+
 
+def frame_text(text: str) -> bytes:
+    return frame_data(text.encode("utf-8"))
 
-def which_or_none(cmd: str) -> Optional[str]:
-    return shutil.which(cmd)
 
+def _resolve_tools(tools):
+    # shutil.which walks $PATH with a stat() per directory; resolve once at
+    # import instead of on every clipboard access.
+    return [(path, args, err_msg) for name, args, err_msg in tools if (path := shutil.which(name))]
 
-def read_clipboard_text(timeout: float = 1.0) -> Tuple[bool, Optional[str]]:
-    tools = [
+
+_READ_TOOLS = _resolve_tools(
+    [
         ("wl-paste", ["--type", "text", "--no-newline"], "wl-paste read failed: %s"),
         ("xclip", ["-selection", "clipboard", "-out"], "xclip read failed: %s"),
         ("xsel", ["--clipboard", "--output"], "xsel read failed: %s"),
     ]
+)
+
+_WRITE_TOOLS = _resolve_tools(
+    [
+        ("wl-copy", [], "wl-copy write failed: %s"),
+        ("xclip", ["-selection", "clipboard", "-in"], "xclip write failed: %s"),
+        ("xsel", ["--clipboard", "--input"], "xsel write failed: %s"),
+    ]
+)
 
-    for name, args, err_msg in tools:
-        path = which_or_none(name)
-        if not path:
-            continue
+
+def read_clipboard_text(timeout: float = 1.0) -> Tuple[bool, Optional[str]]:
+    for path, args, err_msg in _READ_TOOLS:
         try:
             cp = subprocess.run(
                 [path, *args],
@@ -58,22 +93,12 @@ def read_clipboard_text(timeout: float = 1.0) -> Tuple[bool, Optional[str]]:
     return False, None
 
 
-def write_clipboard_text(text: str) -> bool:
-    tools = [
-        ("wl-copy", [], "wl-copy write failed: %s"),
-        ("xclip", ["-selection", "clipboard", "-in"], "xclip write failed: %s"),
-        ("xsel", ["--clipboard", "--input"], "xsel write failed: %s"),
-    ]
-
-    for name, args, err_msg in tools:
-        path = which_or_none(name)
-        if not path:
-            continue
+def write_clipboard_text_bytes(data: bytes) -> bool:
+    for path, args, err_msg in _WRITE_TOOLS:
         try:
             subprocess.run(
                 [path, *args],
-                input=text,
-                text=True,
+                input=data,
                 check=False,
                 timeout=1.0,
             )
@@ -85,11 +110,242 @@ def write_clipboard_text(text: str) -> bool:
     return False
 
 
+def write_clipboard_text(text: str) -> bool:
+    return write_clipboard_text_bytes(text.encode("utf-8"))
+
+
+class ClipboardBackend:
+    name = "subprocess"
+    event_driven = False
+
+    def read(self) -> Tuple[bool, Optional[str]]:
+        return read_clipboard_text(timeout=1.0)
+
+    def drain_events(self) -> bool:
+        return False
+
+    def pending_change(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+class X11ClipboardBackend(ClipboardBackend):
+    name = "x11"
+    event_driven = True
+
+    def __init__(self):
+        if _x_display is None:
+            raise RuntimeError("python-xlib not available")
+        self.display = _x_display.Display()
+        self.display.xfixes_query_version()
+        screen = self.display.screen()
+        self.root = screen.root
+        self.clipboard = self.display.get_atom("CLIPBOARD")
+        self.utf8 = self.display.get_atom("UTF8_STRING")
+        self.incr = self.display.get_atom("INCR")
+        self.prop = self.display.get_atom("CLIPBRIDGE_SELECTION")
+        self.window = self.root.create_window(0, 0, 1, 1, 0, screen.root_depth)
+        self._pending_change = False
+        self.display.xfixes_select_selection_input(
+            self.root,
+            self.clipboard,
+            _x_xfixes.XFixesSetSelectionOwnerNotifyMask,
+        )
+        self.display.flush()
+
+    def fileno(self) -> int:
+        return self.display.fileno()
+
+    def drain_events(self) -> bool:
+        while self.display.pending_events():
+            event = self.display.next_event()
+            if (event.type, getattr(event, "sub_code", None)) == self.display.extension_event.SetSelectionOwnerNotify:
+                self._pending_change = True
+        return self.pending_change()
+
+    def pending_change(self) -> bool:
+        changed = self._pending_change
+        self._pending_change = False
+        return changed
+
+    def read(self) -> Tuple[bool, Optional[str]]:
+        if self.display.get_selection_owner(self.clipboard) == X.NONE:
+            return True, ""
+        self.window.convert_selection(self.clipboard, self.utf8, self.prop, X.CurrentTime)
+        self.display.flush()
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            if self.display.pending_events() == 0:
+                time.sleep(0.005)
+                continue
+            event = self.display.next_event()
+            if event.type != X.SelectionNotify:
+                # Owner changes landing mid-read are edge-triggered; flag
+                # them so the caller re-reads instead of losing the change.
+                if (event.type, getattr(event, "sub_code", None)) == self.display.extension_event.SetSelectionOwnerNotify:
+                    self._pending_change = True
+                continue
+            if event.property == X.NONE:
+                return False, None
+            reply = self.window.get_full_property(self.prop, X.AnyPropertyType)
+            self.window.delete_property(self.prop)
+            if reply is None:
+                return False, None
+            if reply.property_type == self.incr:
+                # Data above the X max-request size arrives via the chunked
+                # INCR protocol; the property only holds a size cookie here.
+                # Hand the transfer to the subprocess tools, which speak it.
+                logger.debug("X11 selection uses INCR transfer, using subprocess reader")
+                return read_clipboard_text(timeout=1.0)
+            value = reply.value
+            if isinstance(value, bytes):
+                value = value.decode("utf-8", "replace")
+            return True, value
+        return False, None
+
+    def close(self) -> None:
+        try:
+            self.display.close()
+        except Exception:
+            pass
+
+
+class WaylandClipboardBackend(ClipboardBackend):
+    name = "wayland"
+    event_driven = True
+
+    def __init__(self):
+        if _WlDisplay is None:
+            raise RuntimeError("pywayland wlr-data-control bindings not available")
+        self.display = _WlDisplay()
+        self.display.connect()
+        self._manager = None
+        self._seat = None
+        self._offer = None
+        self._offer_mimes: List[str] = []
+        self._changed = False
+        registry = self.display.get_registry()
+        registry.dispatcher["global"] = self._on_global
+        self.display.roundtrip()
+        if self._manager is None or self._seat is None:
+            self.display.disconnect()
+            raise RuntimeError("compositor lacks zwlr_data_control_manager_v1")
+        self.device = self._manager.get_data_device(self._seat)
+        self.device.dispatcher["data_offer"] = self._on_data_offer
+        self.device.dispatcher["selection"] = self._on_selection
+        self.display.roundtrip()
+
+    def _on_global(self, registry, name, interface, version):
+        if interface == "zwlr_data_control_manager_v1":
+            self._manager = registry.bind(name, ZwlrDataControlManagerV1, min(version, 1))
+        elif interface == "wl_seat" and self._seat is None:
+            self._seat = registry.bind(name, WlSeat, min(version, 1))
+
+    def _on_data_offer(self, device, offer):
+        offer.dispatcher["offer"] = self._on_offer_mime
+        self._offer_mimes = []
+
+    def _on_offer_mime(self, offer, mime_type):
+        self._offer_mimes.append(mime_type)
+
+    def _on_selection(self, device, offer):
+        # Each selection event carries a fresh offer; the superseded one
+        # must be destroyed or it leaks a protocol object on every change.
+        if self._offer is not None and self._offer is not offer:
+            try:
+                self._offer.destroy()
+            except Exception:
+                pass
+        self._offer = offer
+        self._changed = True
+
+    def fileno(self) -> int:
+        return self.display.get_fd()
+
+    def drain_events(self) -> bool:
+        self._changed = False
+        self.display.dispatch(block=True)
+        return self._changed
+
+    def read(self) -> Tuple[bool, Optional[str]]:
+        if self._offer is None:
+            return True, ""
+        mime = next((m for m in self._offer_mimes if m.startswith("text/plain")), None)
+        if mime is None and "UTF8_STRING" in self._offer_mimes:
+            mime = "UTF8_STRING"
+        if mime is None:
+            return False, None
+        r, w = os.pipe()
+        try:
+            self._offer.receive(mime, w)
+            self.display.flush()
+        finally:
+            os.close(w)
+        # The selection owner may never write or never close its end; this
+        # runs on the reactor thread, so bound the read like the X11 path.
+        os.set_blocking(r, False)
+        chunks = []
+        deadline = time.monotonic() + 1.0
+        try:
+            while True:
+                try:
+                    chunk = os.read(r, 65536)
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        return False, None
+                    time.sleep(0.005)
+                    continue
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return False, None
+        finally:
+            os.close(r)
+        return True, b"".join(chunks).decode("utf-8", "replace")
+
+    def close(self) -> None:
+        if self._offer is not None:
+            try:
+                self._offer.destroy()
+            except Exception:
+                pass
+            self._offer = None
+        try:
+            self.display.disconnect()
+        except Exception:
+            pass
+
+
+def create_clipboard_backend() -> ClipboardBackend:
+    if os.environ.get("WAYLAND_DISPLAY"):
+        try:
+            return WaylandClipboardBackend()
+        except Exception as e:
+            logger.debug("Wayland backend unavailable: %s", e)
+    if os.environ.get("DISPLAY"):
+        try:
+            return X11ClipboardBackend()
+        except Exception as e:
+            logger.debug("X11 backend unavailable: %s", e)
+    return ClipboardBackend()
+
+
 class ClientState:
     def __init__(self, sock: socket.socket, label: str):
         self.sock = sock
         self.label = label
-        self.rbuf = bytearray()
+        self.rbuf = bytearray(RBUF_SIZE)
+        self.rpos = 0
+        self.wpos = 0
+        # Outbound frames are immutable bytes shared across clients; only
+        # the send offset into the head frame is per-client.
+        self.wqueue: Deque[bytes] = deque()
+        self.woff = 0
+        self.wsize = 0
+        self.want_write = False
 
 
 class BridgeServer:
@@ -99,26 +355,48 @@ class BridgeServer:
         self.poll_interval = max(50, poll_ms) / 1000.0
         self.sel = selectors.DefaultSelector()
         self.server: Optional[socket.socket] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
         self.clients: Dict[socket.socket, ClientState] = {}
-        self.to_broadcast: "queue.Queue[bytes]" = queue.Queue()
-        self._lock = threading.Lock()
+        self._pending_data: Optional[bytes] = None
+        self._flush_deadline: float = 0.0
+        self._coalesced = 0
+        # Connection state is owned by the reactor thread; only the pending
+        # slot is shared with the fallback polling watcher.
+        self._pending_lock = threading.Lock()
         self._stop = threading.Event()
         self._last_polled: Optional[str] = None
-        self._last_sent_from_pc: Optional[str] = None
+        self._last_sent_from_pc: Optional[bytes] = None
+        self._last_applied: Optional[bytes] = None
+        self.backend = create_clipboard_backend()
 
     def start(self) -> None:
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
         self.server.bind((self.host, self.port))
         self.server.listen(8)
         self.server.setblocking(False)
         self.sel.register(self.server, selectors.EVENT_READ)
 
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.sel.register(self._wake_r, selectors.EVENT_READ)
+
         logger.info("Server listening on %s:%d", self.host, self.port)
 
-        t = threading.Thread(target=self._clipboard_watch_loop, daemon=True)
-        t.start()
-        logger.info("Clipboard watcher started (poll=%dms)", int(self.poll_interval * 1000))
+        if self.backend.event_driven:
+            self.sel.register(self.backend, selectors.EVENT_READ)
+            logger.info("Clipboard watcher registered (backend=%s, event-driven)", self.backend.name)
+        else:
+            t = threading.Thread(target=self._clipboard_watch_loop, daemon=True)
+            t.start()
+            logger.info("Clipboard watcher started (backend=%s, poll=%dms)", self.backend.name, int(self.poll_interval * 1000))
 
         try:
             self._serve_loop()
@@ -133,61 +411,102 @@ class BridgeServer:
             self.sel.close()
         except Exception:
             pass
-        with self._lock:
-            count = len(self.clients)
-            for st in list(self.clients.values()):
-                try:
-                    st.sock.close()
-                except Exception:
-                    pass
-            self.clients.clear()
+        count = len(self.clients)
+        for st in list(self.clients.values()):
+            try:
+                st.sock.close()
+            except Exception:
+                pass
+        self.clients.clear()
         if self.server:
             try:
                 self.server.close()
             except Exception:
                 pass
             self.server = None
+        for s in (self._wake_r, self._wake_w):
+            if s:
+                try:
+                    s.close()
+                except Exception:
+                    pass
+        self._wake_r = self._wake_w = None
+        self.backend.close()
         logger.info("Shutdown complete, closed %d client(s)", count)
 
     def _serve_loop(self) -> None:
         while not self._stop.is_set():
-            events = self.sel.select(timeout=1.0)
+            timeout = None
+            with self._pending_lock:
+                if self._pending_data is not None:
+                    timeout = max(0.0, self._flush_deadline - time.monotonic())
+            events = self.sel.select(timeout=timeout)
             for key, mask in events:
                 if key.fileobj is self.server:
                     self._accept()
+                elif key.fileobj is self._wake_r:
+                    try:
+                        self._wake_r.recv(4096)
+                    except (BlockingIOError, OSError):
+                        pass
+                elif key.fileobj is self.backend:
+                    self._handle_clipboard_event()
                 else:
-                    self._handle_client(key.fileobj)  # type: ignore[arg-type]
+                    sock = key.fileobj
+                    if mask & selectors.EVENT_WRITE:
+                        state = self.clients.get(sock)  # type: ignore[arg-type]
+                        if state:
+                            self._flush(state)
+                    if mask & selectors.EVENT_READ and sock in self.clients:
+                        self._handle_client(sock)  # type: ignore[arg-type]
             self._broadcast_pending()
 
     def _accept(self) -> None:
         assert self.server is not None
         conn, addr = self.server.accept()
         conn.setblocking(False)
+        # Small frames must not sit in Nagle's buffer, and dead peers should
+        # be noticed without waiting for a broadcast to fail.
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            try:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 30_000)
+            except OSError:
+                pass
         self.sel.register(conn, selectors.EVENT_READ)
         state = ClientState(conn, f"{addr[0]}:{addr[1]}")
-        with self._lock:
-            self.clients[conn] = state
+        self.clients[conn] = state
         logger.info("Client connected: %s (clients=%d)", state.label, len(self.clients))
 
-        ok, txt = read_clipboard_text(timeout=0.5)
+        try:
+            ok, txt = self.backend.read()
+        except Exception as e:
+            logger.warning("Clipboard read failed during accept: %s", e)
+            ok, txt = False, None
         if ok and txt is not None and txt != "":
             try:
-                conn.sendall(frame_text(txt))
-                logger.debug("Pushed initial clipboard (%d bytes) to %s", len(txt.encode()), state.label)
-            except BlockingIOError:
-                logger.warning("Initial send would block -> dropping %s", state.label)
-                self._drop_client(conn)
-            except Exception as e:
-                logger.warning("Initial send failed for %s: %s", state.label, e)
-                self._drop_client(conn)
+                frame = frame_text(txt)
+            except ValueError:
+                logger.warning("Initial clipboard too large to push to %s", state.label)
+                return
+            self._send_to(state, frame)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pushed initial clipboard (%d bytes) to %s", len(frame) - 5, state.label)
 
     def _handle_client(self, sock: socket.socket) -> None:
         state = self.clients.get(sock)
         if not state:
             self._drop_client(sock)
             return
+        if state.wpos == len(state.rbuf):
+            # A partial frame is parked at the end of the buffer; move it to
+            # the front to make room for the next recv.
+            state.rbuf[: state.wpos - state.rpos] = state.rbuf[state.rpos : state.wpos]
+            state.wpos -= state.rpos
+            state.rpos = 0
         try:
-            chunk = sock.recv(65536)
+            n = sock.recv_into(memoryview(state.rbuf)[state.wpos :])
         except BlockingIOError:
             return
         except Exception as e:
@@ -195,53 +514,77 @@ class BridgeServer:
             self._drop_client(sock)
             return
 
-        if not chunk:
+        if n == 0:
             logger.info("Client closed: %s", state.label)
             self._drop_client(sock)
             return
 
-        state.rbuf.extend(chunk)
-        logger.debug("Received %d bytes from %s (buffer=%d)", len(chunk), state.label, len(state.rbuf))
+        state.wpos += n
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received %d bytes from %s (buffer=%d)", n, state.label, state.wpos - state.rpos)
         self._process_frames(state)
 
     def _process_frames(self, state: ClientState) -> None:
         buf = state.rbuf
-        while True:
-            if len(buf) < 5:
-                break
-            if buf[0] != MSG_TEXT:
-                logger.warning("Bad frame type from %s", state.label)
-                self._drop_client(state.sock)
-                return
-            length = struct.unpack(">I", buf[1:5])[0]
-            if length < 0 or length > MAX_BYTES:
-                logger.warning("Bad frame length %d from %s", length, state.label)
-                self._drop_client(state.sock)
-                return
-            if len(buf) < 5 + length:
-                break
-            payload = bytes(buf[5 : 5 + length])
-            del buf[: 5 + length]
-            try:
-                text = payload.decode("utf-8")
-            except Exception as e:
-                logger.warning("UTF-8 decode failed from %s: %s", state.label, e)
-                continue
-            self._on_text_from_client(state.sock, text)
-
-    def _on_text_from_client(self, sender: socket.socket, text: str) -> None:
-        self._last_sent_from_pc = text
-        ok = write_clipboard_text(text)
-        logger.info(
-            "Applied text from client (%d bytes, ok=%s)",
-            len(text.encode("utf-8")),
-            ok,
-        )
-        self._broadcast(frame_text(text), exclude=sender)
+        rpos = state.rpos
+        wpos = state.wpos
+        out_frames: List[bytes] = []
+        drop_sender = False
+        mv = memoryview(buf)
+        try:
+            while True:
+                if wpos - rpos < 5:
+                    break
+                typ, length = _HDR.unpack_from(buf, rpos)
+                if typ != MSG_TEXT:
+                    logger.warning("Bad frame type from %s", state.label)
+                    drop_sender = True
+                    break
+                if length > MAX_BYTES:
+                    logger.warning("Bad frame length %d from %s", length, state.label)
+                    drop_sender = True
+                    break
+                if wpos - rpos < 5 + length:
+                    break
+                payload_mv = mv[rpos + 5 : rpos + 5 + length]
+                rpos += 5 + length
+                # The server only forwards the payload; validate it as UTF-8
+                # when debugging rather than decoding on every frame.
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        str(payload_mv, "utf-8")
+                    except UnicodeDecodeError as e:
+                        logger.debug("Non-UTF-8 payload from %s: %s", state.label, e)
+                payload = payload_mv.tobytes()
+                payload_mv.release()
+                frame = self._on_text_from_client(state.sock, payload)
+                if frame:
+                    out_frames.append(frame)
+        finally:
+            mv.release()
+        if rpos == wpos:
+            rpos = 0
+            state.wpos = 0
+        state.rpos = rpos
+        # Valid frames parsed before a bad one were already applied locally,
+        # so broadcast them even when the sender is about to be dropped.
+        if out_frames and any(s is not state.sock for s in self.clients):
+            self._broadcast_frames(out_frames, exclude=state.sock)
+        if drop_sender:
+            self._drop_client(state.sock)
+
+    def _on_text_from_client(self, sender: socket.socket, payload: bytes) -> Optional[bytes]:
+        if payload == self._last_applied:
+            logger.debug("Duplicate payload from client, skipping apply")
+            return None
+        self._last_applied = payload
+        self._last_sent_from_pc = payload
+        ok = write_clipboard_text_bytes(payload)
+        logger.info("Applied text from client (%d bytes, ok=%s)", len(payload), ok)
+        return frame_data(payload)
 
     def _drop_client(self, sock: socket.socket) -> None:
-        with self._lock:
-            st = self.clients.pop(sock, None)
+        st = self.clients.pop(sock, None)
         try:
             self.sel.unregister(sock)
         except Exception:
@@ -253,57 +596,164 @@ class BridgeServer:
         if st:
             logger.info("Client dropped: %s (clients=%d)", st.label, len(self.clients))
 
-    def _broadcast(self, payload: bytes, exclude: Optional[socket.socket] = None) -> None:
-        with self._lock:
-            targets = list(self.clients.keys())
-        sent = 0
-        for c in targets:
-            if c is exclude:
-                continue
+    def _send_to(self, state: ClientState, payload: bytes) -> bool:
+        if state.wsize + len(payload) > MAX_WBUF_BYTES:
+            logger.info("Client too slow (txbuf=%d) -> dropping %s", state.wsize, state.label)
+            self._drop_client(state.sock)
+            return False
+        state.wqueue.append(payload)
+        state.wsize += len(payload)
+        self._flush(state)
+        return True
+
+    def _flush(self, state: ClientState) -> None:
+        sock = state.sock
+        while state.wqueue:
+            frame = state.wqueue[0]
+            rest = memoryview(frame)[state.woff :]
             try:
-                c.sendall(payload)
-                sent += 1
+                # When more data remains after this send, MSG_MORE lets the
+                # kernel hold back partial segments until the final one.
+                if _MSG_MORE and (len(state.wqueue) > 1 or len(rest) > MAX_BATCH_BYTES):
+                    n = sock.send(rest[:MAX_BATCH_BYTES], _MSG_MORE)
+                else:
+                    n = sock.send(rest)
             except BlockingIOError:
-                logger.info("Send would block -> dropping client")
-                self._drop_client(c)
+                break
             except Exception as e:
                 logger.info("Send failed -> dropping client: %s", e)
-                self._drop_client(c)
-        if sent:
+                self._drop_client(sock)
+                return
+            if n == 0:
+                break
+            state.woff += n
+            state.wsize -= n
+            if state.woff == len(frame):
+                state.wqueue.popleft()
+                state.woff = 0
+        want_write = bool(state.wqueue)
+        if want_write != state.want_write:
+            state.want_write = want_write
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if want_write else 0)
+            try:
+                self.sel.modify(sock, events)
+            except Exception:
+                pass
+
+    def _broadcast(self, payload: bytes, exclude: Optional[socket.socket] = None) -> None:
+        targets = list(self.clients.values())
+        sent = 0
+        for st in targets:
+            if st.sock is exclude:
+                continue
+            if self._send_to(st, payload):
+                sent += 1
+        if sent and logger.isEnabledFor(logging.DEBUG):
             logger.debug("Broadcasted frame to %d client(s)", sent)
 
+    def _broadcast_frames(self, frames: List[bytes], exclude: Optional[socket.socket] = None) -> None:
+        if len(frames) == 1:
+            self._broadcast(frames[0], exclude=exclude)
+            return
+        # Coalesce back-to-back frames into one send() per client, capped so
+        # a long batch does not add latency to the frames at its head.
+        batch: List[bytes] = []
+        size = 0
+        for frame in frames:
+            if batch and size + len(frame) > MAX_BATCH_BYTES:
+                self._broadcast(b"".join(batch), exclude=exclude)
+                batch = []
+                size = 0
+            batch.append(frame)
+            size += len(frame)
+        if batch:
+            self._broadcast(b"".join(batch), exclude=exclude)
+
     def _broadcast_pending(self) -> None:
-        flushed = 0
-        while True:
-            try:
-                payload = self.to_broadcast.get_nowait()
-            except queue.Empty:
-                break
-            self._broadcast(payload)
-            flushed += 1
-        if flushed:
-            logger.debug("Flushed %d queued frame(s)", flushed)
+        with self._pending_lock:
+            data = self._pending_data
+            if data is None or time.monotonic() < self._flush_deadline:
+                return
+            self._pending_data = None
+            coalesced, self._coalesced = self._coalesced, 0
+        if coalesced:
+            logger.debug("Coalesced %d superseded clipboard update(s)", coalesced)
+        self._broadcast(frame_data(data))
 
     def queue_from_pc(self, text: str) -> None:
-        self._last_sent_from_pc = text
-        self.to_broadcast.put(frame_text(text))
-        logger.info("Queued clipboard change from PC (%d bytes)", len(text.encode("utf-8")))
+        self._queue_pending(text.encode("utf-8"))
+
+    def _queue_pending(self, data: bytes) -> None:
+        if len(data) > MAX_BYTES:
+            logger.warning("Clipboard text too large to forward (%d bytes)", len(data))
+            return
+        self._last_sent_from_pc = data
+        self._last_applied = data
+        with self._pending_lock:
+            # The slot is last-write-wins: a superseded update is dropped
+            # rather than queued, which bounds memory at one frame.
+            if self._pending_data is not None:
+                self._coalesced += 1
+            self._pending_data = data
+            self._flush_deadline = time.monotonic() + DEBOUNCE_SECONDS
+        if self._wake_w:
+            try:
+                self._wake_w.send(b"\x00")
+            except (BlockingIOError, OSError):
+                pass
+        logger.info("Pending clipboard change from PC (%d bytes)", len(data))
+
+    def _handle_clipboard_event(self) -> None:
+        try:
+            if not self.backend.drain_events():
+                return
+            while True:
+                ok, txt = self.backend.read()
+                if ok and txt:
+                    data = txt.encode("utf-8")
+                    if data != self._last_sent_from_pc:
+                        self._queue_pending(data)
+                # A change flagged while the read was in flight will not wake
+                # the selector again, so service it before returning.
+                if not self.backend.pending_change():
+                    break
+        except Exception as e:
+            # X server restart, compositor exit, protocol error: the event
+            # backend is gone, but the bridge can still poll.
+            logger.warning("Clipboard backend failed (%s), falling back to polling", e)
+            self._demote_backend()
+
+    def _demote_backend(self) -> None:
+        try:
+            self.sel.unregister(self.backend)
+        except Exception:
+            pass
+        try:
+            self.backend.close()
+        except Exception:
+            pass
+        self.backend = ClipboardBackend()
+        t = threading.Thread(target=self._clipboard_watch_loop, daemon=True)
+        t.start()
+        logger.info("Clipboard watcher started (backend=%s, poll=%dms)", self.backend.name, int(self.poll_interval * 1000))
 
     def _clipboard_watch_loop(self) -> None:
         while not self._stop.is_set():
-            ok, txt = read_clipboard_text(timeout=1.0)
+            ok, txt = self.backend.read()
             if ok:
                 if txt is None:
                     pass
                 else:
                     if self._last_polled is None or txt != self._last_polled:
-                        if txt != self._last_sent_from_pc:
-                            if txt != "":
-                                self.queue_from_pc(txt)
+                        if txt != "":
+                            data = txt.encode("utf-8")
+                            if data != self._last_sent_from_pc:
+                                self._queue_pending(data)
                         self._last_polled = txt
             else:
                 logger.debug("Clipboard read returned not-ok")
-            time.sleep(self.poll_interval)
+            if self._stop.wait(self.poll_interval):
+                break
 
 
 def parse_args() -> argparse.Namespace: